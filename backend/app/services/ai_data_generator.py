@@ -66,6 +66,24 @@ class AdvancedDataGenerator:
             "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
             "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ"
         ]
+        
+        # Field type -> value generator, built once instead of an if/elif chain per value
+        self._value_generators = {
+            FieldType.EMAIL: lambda field, scenario: self._generate_email(scenario, field.validation),
+            FieldType.PASSWORD: lambda field, scenario: self._generate_password(scenario, field.validation),
+            FieldType.PHONE: lambda field, scenario: self._generate_phone(scenario),
+            FieldType.TEXT: lambda field, scenario: self._generate_text(scenario, field),
+            FieldType.NUMBER: lambda field, scenario: self._generate_number(scenario, field.validation),
+            FieldType.DATE: lambda field, scenario: self._generate_date(scenario),
+            FieldType.TIME: lambda field, scenario: self._generate_time(scenario),
+            FieldType.DATETIME: lambda field, scenario: self._generate_datetime(scenario),
+            FieldType.URL: lambda field, scenario: self._generate_url(scenario),
+            FieldType.CHECKBOX: lambda field, scenario: self._generate_checkbox(scenario),
+            FieldType.RADIO: lambda field, scenario: self._generate_radio(scenario, field.options),
+            FieldType.SELECT: lambda field, scenario: self._generate_select(scenario, field.options),
+            FieldType.TEXTAREA: lambda field, scenario: self._generate_textarea(scenario, field.validation),
+            FieldType.FILE: lambda field, scenario: self._generate_file(scenario),
+        }
 
     def generate_field_data(
         self, 
@@ -98,54 +116,26 @@ class AdvancedDataGenerator:
             logger.error(f"Error generating data for field {field.field_id}: {str(e)}")
             return []
 
+    def generate_bulk(
+        self,
+        fields: List[FormField],
+        scenario: TestScenario = TestScenario.VALID,
+        count: int = 1
+    ) -> List[Dict[str, Any]]:
+        """Generate test data for several fields in one call, in field order"""
+        data_list = []
+        for field in fields:
+            data_list.extend(self.generate_field_data(field, scenario, count))
+        return data_list
+
     def _generate_value_by_type(self, field: FormField, scenario: TestScenario) -> str:
         """Generate value based on field type and scenario"""
         
-        if field.type == FieldType.EMAIL:
-            return self._generate_email(scenario, field.validation)
-            
-        elif field.type == FieldType.PASSWORD:
-            return self._generate_password(scenario, field.validation)
-            
-        elif field.type == FieldType.PHONE:
-            return self._generate_phone(scenario)
-            
-        elif field.type == FieldType.TEXT:
-            return self._generate_text(scenario, field)
-            
-        elif field.type == FieldType.NUMBER:
-            return self._generate_number(scenario, field.validation)
-            
-        elif field.type == FieldType.DATE:
-            return self._generate_date(scenario)
-            
-        elif field.type == FieldType.TIME:
-            return self._generate_time(scenario)
-            
-        elif field.type == FieldType.DATETIME:
-            return self._generate_datetime(scenario)
-            
-        elif field.type == FieldType.URL:
-            return self._generate_url(scenario)
-            
-        elif field.type == FieldType.CHECKBOX:
-            return self._generate_checkbox(scenario)
-            
-        elif field.type == FieldType.RADIO:
-            return self._generate_radio(scenario, field.options)
-            
-        elif field.type == FieldType.SELECT:
-            return self._generate_select(scenario, field.options)
-            
-        elif field.type == FieldType.TEXTAREA:
-            return self._generate_textarea(scenario, field.validation)
-            
-        elif field.type == FieldType.FILE:
-            return self._generate_file(scenario)
-            
-        else:
+        generator = self._value_generators.get(field.type)
+        if generator is None:
             # Default to text generation
             return self._generate_text(scenario, field)
+        return generator(field, scenario)
 
     def _generate_email(self, scenario: TestScenario, validation: Optional[FieldValidation] = None) -> str:
         """Generate email addresses"""
@@ -392,15 +382,9 @@ class AIDataGenerator:
         }
         
         for scenario in scenarios:
-            scenario_data = []
-            
-            for field in fields:
-                field_data = self.fallback_generator.generate_field_data(
-                    field, scenario, count_per_scenario
-                )
-                scenario_data.extend(field_data)
-            
-            result["test_data"][scenario.value] = scenario_data
+            result["test_data"][scenario.value] = self.fallback_generator.generate_bulk(
+                fields, scenario, count_per_scenario
+            )
         
         logger.info(f"Generated test data for {len(fields)} fields across {len(scenarios)} scenarios")
         return result
@@ -1,12 +1,14 @@
 import pytest
 import pytest_asyncio
-import asyncio
+import anyio
 import httpx
+from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.database import get_db, Base
 from app.models.schemas import MetadataCreate, FormField, FieldType, FieldValidation, SourceType
+from tests.helpers import EXTRACT_BODY, JSON_HEADERS, jload
 
 
 # Test database setup
@@ -34,15 +36,33 @@ async def override_get_db():
 app.dependency_overrides[get_db] = override_get_db
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "real_browser: run the real Playwright test runner in background tasks"
+    )
+
+
+@pytest.fixture(autouse=True)
+def stub_playwright_runner(request, monkeypatch):
+    """Replace the background Playwright run with a no-op unless marked real_browser"""
+    if request.node.get_closest_marker("real_browser"):
+        return
+    
+    async def noop_test_run(*args, **kwargs):
+        return None
+    
+    monkeypatch.setattr("app.api.testing.execute_test_run", noop_test_run)
 
 
-@pytest_asyncio.fixture(scope="session")
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop shared with the fixtures"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def setup_database():
     """Setup test database"""
     async with test_engine.begin() as conn:
@@ -52,22 +72,50 @@ async def setup_database():
         await conn.run_sync(Base.metadata.drop_all)
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def clean_database():
-    """Clean database before each test"""
+    """Clean database for tests that need an empty state"""
     async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
 
-@pytest_asyncio.fixture
-async def client(setup_database, clean_database):
-    """Create test client"""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(setup_database):
+    """Create test client shared across the test session"""
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def sample_metadata_id(client):
+    """Extract metadata once per module and delete it afterwards
+    
+    Modules using this fixture set an xdist_group marker so that
+    `pytest -n auto --dist loadgroup` keeps them on a single worker.
+    """
+    response = await client.post("/extract/url", content=EXTRACT_BODY, headers=JSON_HEADERS)
+    assert response.status_code == 201
+    metadata_id = jload(response)["id"]
+    yield metadata_id
+    await client.delete(f"/metadata/{metadata_id}")
+
+
+@pytest.fixture(scope="session")
+def sync_client(setup_database):
+    """Create synchronous test client for single-request tests
+
+    The client is not entered with `with`, since that would run the app lifespan
+    against the real database. Without that, every request would start a new
+    portal thread and event loop, so the client shares one blocking portal instead.
+    """
+    client = TestClient(app)
+    with anyio.from_thread.start_blocking_portal(**client.async_backend) as portal:
+        client.portal = portal
+        yield client
+
+
 @pytest.fixture
 def sample_metadata_create():
     """Sample metadata for testing"""
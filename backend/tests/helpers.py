@@ -0,0 +1,21 @@
+"""Shared request bodies and response helpers for the API tests"""
+import json
+import orjson
+
+
+# Pre-serialized request bodies for the httpbin form extraction and test runs used across tests
+EXTRACT_BODY = json.dumps({
+    "url": "https://httpbin.org/forms/post",
+    "wait_for_js": False,
+    "timeout": 30
+}).encode()
+TEST_RUN_BODY = json.dumps({
+    "use_ai_data": True,
+    "test_scenarios": ["valid_data"]
+}).encode()
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def jload(response):
+    """Decode a JSON response body with orjson"""
+    return orjson.loads(response.content)
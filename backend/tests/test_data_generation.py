@@ -7,6 +7,11 @@ from app.services.ai_data_generator import AIDataGenerator, AdvancedDataGenerato
 from app.models.schemas import FormField, FieldType, FieldValidation
 
 
+_COUNTRIES = frozenset({"USA", "Canada", "UK", "Australia"})
+_OPTION_FIELD_TYPES = frozenset({FieldType.SELECT, FieldType.RADIO})
+_DEFAULT_OPTIONS = ("option1", "option2")
+
+
 @pytest.fixture
 def data_generator():
     """Create data generator instance"""
@@ -230,13 +235,13 @@ def test_generate_select_field(data_generator):
     for item in data:
         assert item["field_id"] == "country"
         assert item["scenario"] == "valid"
-        assert item["value"] in ["USA", "Canada", "UK", "Australia"]
+        assert item["value"] in _COUNTRIES
     
     # Test invalid selection
     invalid_data = data_generator.generate_field_data(select_field, TestScenario.INVALID, 3)
     for item in invalid_data:
         assert item["scenario"] == "invalid"
-        assert item["value"] not in ["USA", "Canada", "UK", "Australia"]
+        assert item["value"] not in _COUNTRIES
 
 
 @pytest.mark.asyncio
@@ -280,6 +285,33 @@ async def test_ai_generator_integration(ai_data_generator, sample_email_field, s
     assert valid_fields.count("password") == 2
 
 
+@pytest.mark.asyncio
+async def test_ai_generator_integration_concurrent(ai_data_generator, sample_email_field, sample_password_field):
+    """Test per-field concurrent generation matches the sequential integration path"""
+    fields = [sample_email_field, sample_password_field]
+    scenarios = [TestScenario.VALID, TestScenario.INVALID]
+    
+    sequential = await ai_data_generator.generate_test_data(
+        fields=fields,
+        scenarios=scenarios,
+        count_per_scenario=2,
+        use_ai=False
+    )
+    
+    concurrent = await asyncio.gather(*[
+        ai_data_generator.generate_field_data(field, scenario, 2)
+        for scenario in scenarios
+        for field in fields
+    ])
+    
+    # Results come back in submission order: scenario-major, then field
+    for i, scenario in enumerate(scenarios):
+        expected = sequential["test_data"][scenario.value]
+        actual = [item for field_data in concurrent[i * len(fields):(i + 1) * len(fields)] for item in field_data]
+        assert [item["field_id"] for item in actual] == [item["field_id"] for item in expected]
+        assert all(item["scenario"] == scenario.value for item in actual)
+
+
 @pytest.mark.asyncio 
 async def test_single_field_generation(ai_data_generator, sample_email_field):
     """Test single field data generation"""
@@ -310,7 +342,7 @@ def test_all_field_types_generate(data_generator):
             required=False,
             placeholder="",
             default_value="",
-            options=["option1", "option2"] if field_type in [FieldType.SELECT, FieldType.RADIO] else [],
+            options=list(_DEFAULT_OPTIONS) if field_type in _OPTION_FIELD_TYPES else [],
             validation=None,
             is_visible=True,
             source_file=None
@@ -325,6 +357,16 @@ def test_all_field_types_generate(data_generator):
             pytest.fail(f"Field type {field_type.value} generation failed: {str(e)}")
 
 
+def test_generate_bulk_matches_per_field(data_generator, sample_email_field, sample_password_field):
+    """Test that bulk generation returns each field's data in field order"""
+    fields = [sample_email_field, sample_password_field]
+    data = data_generator.generate_bulk(fields, TestScenario.VALID, 2)
+    
+    assert [item["field_id"] for item in data] == ["email", "email", "password", "password"]
+    assert all(item["is_valid"] is True for item in data)
+    assert "@" in data[0]["value"]
+
+
 def test_scenario_types_coverage():
     """Test that all scenario types are covered"""
     scenarios = [TestScenario.VALID, TestScenario.INVALID, TestScenario.EDGE_CASE, TestScenario.BOUNDARY]
@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from app.models.schemas import URLExtractionRequest, SourceType
+from tests.helpers import jload
 
 
 @pytest.mark.asyncio
@@ -15,7 +16,7 @@ async def test_extract_url_metadata(client: AsyncClient):
     response = await client.post("/extract/url", json=request_data)
     assert response.status_code == 201
     
-    data = response.json()
+    data = jload(response)
     assert data["page_url"] == "https://example.com/register"
     assert data["source_type"] == SourceType.WEB_PAGE
     assert "id" in data
@@ -24,12 +25,10 @@ async def test_extract_url_metadata(client: AsyncClient):
     assert isinstance(data["fields"], list)
 
 
+@pytest.mark.skip(reason="Skipping GitHub API test to avoid rate limits")
 @pytest.mark.asyncio
 async def test_extract_github_metadata(client: AsyncClient):
     """Test GitHub metadata extraction endpoint"""
-    # Skip this test if we're hitting rate limits
-    pytest.skip("Skipping GitHub API test to avoid rate limits")
-    
     request_data = {
         "repository_url": "https://github.com/octocat/Hello-World",
         "branch": "master",
@@ -39,7 +38,7 @@ async def test_extract_github_metadata(client: AsyncClient):
     response = await client.post("/extract/github", json=request_data)
     assert response.status_code == 201
     
-    data = response.json()
+    data = jload(response)
     assert data["page_url"] == "https://github.com/octocat/Hello-World"
     assert data["source_type"] == SourceType.GITHUB_REPOSITORY
     assert "id" in data
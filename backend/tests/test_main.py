@@ -1,26 +1,24 @@
-import pytest
-from httpx import AsyncClient
+from fastapi.testclient import TestClient
+from tests.helpers import jload
 
 
-@pytest.mark.asyncio
-async def test_health_endpoint(client: AsyncClient):
+def test_health_endpoint(sync_client: TestClient):
     """Test health check endpoint"""
-    response = await client.get("/health")
+    response = sync_client.get("/health")
     assert response.status_code == 200
     
-    data = response.json()
+    data = jload(response)
     assert data["status"] == "healthy"
     assert "timestamp" in data
     assert data["version"] == "1.0.0"
 
 
-@pytest.mark.asyncio
-async def test_root_endpoint(client: AsyncClient):
+def test_root_endpoint(sync_client: TestClient):
     """Test root endpoint"""
-    response = await client.get("/")
+    response = sync_client.get("/")
     assert response.status_code == 200
     
-    data = response.json()
+    data = jload(response)
     assert data["message"] == "UI Testing Framework API"
     assert data["version"] == "1.0.0"
     assert "endpoints" in data
@@ -28,22 +26,21 @@ async def test_root_endpoint(client: AsyncClient):
     assert "health" in data
 
 
-@pytest.mark.asyncio
-async def test_docs_endpoints(client: AsyncClient):
+def test_docs_endpoints(sync_client: TestClient):
     """Test that API documentation endpoints are accessible"""
     # Test OpenAPI docs
-    response = await client.get("/docs")
+    response = sync_client.get("/docs")
     assert response.status_code == 200
     
     # Test ReDoc
-    response = await client.get("/redoc")
+    response = sync_client.get("/redoc")
     assert response.status_code == 200
     
     # Test OpenAPI schema
-    response = await client.get("/openapi.json")
+    response = sync_client.get("/openapi.json")
     assert response.status_code == 200
     
-    schema = response.json()
+    schema = jload(response)
     assert "openapi" in schema
     assert "info" in schema
     assert schema["info"]["title"] == "UI Testing Framework API"
@@ -1,30 +1,29 @@
 import pytest
 from httpx import AsyncClient
+from fastapi.testclient import TestClient
 from app.models.schemas import SourceType
+from tests.helpers import jload
 
 
-@pytest.mark.asyncio
-async def test_get_all_metadata_empty(client: AsyncClient):
+def test_get_all_metadata_empty(sync_client: TestClient, clean_database):
     """Test getting all metadata when database is empty"""
-    response = await client.get("/metadata/")
+    response = sync_client.get("/metadata/")
     assert response.status_code == 200
-    assert response.json() == []
+    assert jload(response) == []
 
 
-@pytest.mark.asyncio
-async def test_get_metadata_by_id_not_found(client: AsyncClient):
+def test_get_metadata_by_id_not_found(sync_client: TestClient):
     """Test getting metadata by ID that doesn't exist"""
-    response = await client.get("/metadata/999")
+    response = sync_client.get("/metadata/999")
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert b"not found" in response.content.lower()
 
 
-@pytest.mark.asyncio
-async def test_delete_metadata_not_found(client: AsyncClient):
+def test_delete_metadata_not_found(sync_client: TestClient):
     """Test deleting metadata that doesn't exist"""
-    response = await client.delete("/metadata/999")
+    response = sync_client.delete("/metadata/999")
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert b"not found" in response.content.lower()
 
 
 @pytest.mark.asyncio
@@ -39,21 +38,21 @@ async def test_metadata_workflow(client: AsyncClient):
     
     create_response = await client.post("/extract/url", json=extract_data)
     assert create_response.status_code == 201
-    metadata_id = create_response.json()["id"]
+    metadata_id = jload(create_response)["id"]
     
     # Get the metadata by ID
     get_response = await client.get(f"/metadata/{metadata_id}")
     assert get_response.status_code == 200
-    data = get_response.json()
+    data = jload(get_response)
     assert data["id"] == metadata_id
     assert data["page_url"] == "https://example.com/test-form"
     
     # Get all metadata (should include our new one)
     all_response = await client.get("/metadata/")
     assert all_response.status_code == 200
-    all_data = all_response.json()
+    all_data = jload(all_response)
     assert len(all_data) >= 1
-    assert any(item["id"] == metadata_id for item in all_data)
+    assert metadata_id in {item["id"] for item in all_data}
     
     # Delete the metadata
     delete_response = await client.delete(f"/metadata/{metadata_id}")
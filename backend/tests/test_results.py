@@ -1,56 +1,35 @@
+import asyncio
 import pytest
 from httpx import AsyncClient
+from tests.helpers import TEST_RUN_BODY, JSON_HEADERS, jload
 
-
-@pytest.mark.asyncio
-async def test_get_test_results_not_found(client: AsyncClient):
-    """Test getting results for non-existent test run"""
-    response = await client.get("/results/999")
-    assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+# Keep tests sharing the module-scoped metadata on one xdist worker (--dist loadgroup)
+pytestmark = pytest.mark.xdist_group("results_workflow")
 
 
+@pytest.mark.parametrize("path", [
+    "/results/999",
+    "/results/999/screenshots",
+    "/results/999/summary",
+])
 @pytest.mark.asyncio
-async def test_get_test_screenshots_not_found(client: AsyncClient):
-    """Test getting screenshots for non-existent test run"""
-    response = await client.get("/results/999/screenshots")
+async def test_get_test_results_not_found(client: AsyncClient, path: str):
+    """Test getting results, screenshots and summary for non-existent test run"""
+    response = await client.get(path)
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert b"not found" in response.content.lower()
 
 
-@pytest.mark.asyncio
-async def test_get_test_summary_not_found(client: AsyncClient):
-    """Test getting summary for non-existent test run"""
-    response = await client.get("/results/999/summary")
-    assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
-
-
-@pytest.mark.asyncio
-async def test_results_workflow(client: AsyncClient):
-    """Test complete results workflow"""
-    # Create metadata and test run
-    extract_data = {
-        "url": "https://httpbin.org/forms/post",
-        "wait_for_js": False,
-        "timeout": 30
-    }
-    
-    create_response = await client.post("/extract/url", json=extract_data)
-    metadata_id = create_response.json()["id"]
-    
-    test_data = {
-        "use_ai_data": True,
-        "test_scenarios": ["valid_data"]
-    }
-    
-    test_response = await client.post(f"/test/{metadata_id}", json=test_data)
-    test_run_id = test_response.json()["id"]
+async def _check_results_workflow(client: AsyncClient, metadata_id: int):
+    """Check complete results workflow"""
+    # Create test run
+    test_response = await client.post(f"/test/{metadata_id}", content=TEST_RUN_BODY, headers=JSON_HEADERS)
+    test_run_id = jload(test_response)["id"]
     
     # Get test results
     results_response = await client.get(f"/results/{test_run_id}")
     assert results_response.status_code == 200
-    results_data = results_response.json()
+    results_data = jload(results_response)
     assert results_data["id"] == test_run_id
     assert results_data["metadata_id"] == metadata_id
     assert "status" in results_data
@@ -58,13 +37,13 @@ async def test_results_workflow(client: AsyncClient):
     # Get screenshots (should be empty for now)
     screenshots_response = await client.get(f"/results/{test_run_id}/screenshots")
     assert screenshots_response.status_code == 200
-    screenshots_data = screenshots_response.json()
+    screenshots_data = jload(screenshots_response)
     assert isinstance(screenshots_data, list)
     
     # Get test summary
     summary_response = await client.get(f"/results/{test_run_id}/summary")
     assert summary_response.status_code == 200
-    summary_data = summary_response.json()
+    summary_data = jload(summary_response)
     assert summary_data["test_run_id"] == test_run_id
     assert summary_data["metadata_id"] == metadata_id
     assert "status" in summary_data
@@ -72,26 +51,17 @@ async def test_results_workflow(client: AsyncClient):
     assert "fields_passed" in summary_data
     assert "fields_failed" in summary_data
     assert "screenshot_count" in summary_data
-    
-    # Clean up
-    await client.delete(f"/metadata/{metadata_id}")
 
 
-@pytest.mark.asyncio
-async def test_summary_calculations(client: AsyncClient):
-    """Test that summary calculations work correctly"""
+async def _check_summary_calculations(client: AsyncClient, metadata_id: int):
+    """Check that summary calculations work correctly"""
     # Create test data
-    extract_data = {"url": "https://example.com/form", "wait_for_js": True, "timeout": 30}
-    create_response = await client.post("/extract/url", json=extract_data)
-    metadata_id = create_response.json()["id"]
-    
-    test_data = {"use_ai_data": True, "test_scenarios": ["valid_data"]}
-    test_response = await client.post(f"/test/{metadata_id}", json=test_data)
-    test_run_id = test_response.json()["id"]
+    test_response = await client.post(f"/test/{metadata_id}", content=TEST_RUN_BODY, headers=JSON_HEADERS)
+    test_run_id = jload(test_response)["id"]
     
     # Get summary
     summary_response = await client.get(f"/results/{test_run_id}/summary")
-    summary_data = summary_response.json()
+    summary_data = jload(summary_response)
     
     # Verify summary structure
     expected_fields = [
@@ -103,6 +73,13 @@ async def test_summary_calculations(client: AsyncClient):
     
     for field in expected_fields:
         assert field in summary_data
-    
-    # Clean up
-    await client.delete(f"/metadata/{metadata_id}")
+
+
+@pytest.mark.asyncio
+async def test_results_workflows(client: AsyncClient, sample_metadata_id: int):
+    """Test results workflow and summary calculations concurrently"""
+    # Both workflows only create their own test runs, so their requests can overlap
+    await asyncio.gather(
+        _check_results_workflow(client, sample_metadata_id),
+        _check_summary_calculations(client, sample_metadata_id),
+    )
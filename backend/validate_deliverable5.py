@@ -4,22 +4,50 @@ Quick validation test for Playwright Test Runner integration
 """
 
 import asyncio
+import io
+import os
 import sys
+import traceback
 from pathlib import Path
 
 # Add backend to Python path
 sys.path.append(str(Path(__file__).parent))
 
-async def test_basic_integration():
+# Import everything under test once, in one group per check, so a broken
+# runner import does not also fail the CRUD check
+try:
+    from app.services.playwright_test_runner import PlaywrightTestRunner, TestResult, ScreenshotManager
+    from app.models.schemas import FormField, FieldType
+    from app.api.testing import execute_test_run
+    _runner_error = None
+except Exception as e:
+    _runner_error = e
+
+try:
+    from app.models.crud import TestRunCRUD, ScreenshotCRUD
+    from app.models.schemas import TestStatus
+    _crud_error = None
+except Exception as e:
+    _crud_error = e
+
+def report_exception(e, out):
+    """Print the full traceback with VALIDATE_VERBOSE set, otherwise a one-line reason"""
+    if os.getenv("VALIDATE_VERBOSE"):
+        traceback.print_exception(type(e), e, e.__traceback__, file=out)
+    else:
+        print(f"   reason: {type(e).__name__} (set VALIDATE_VERBOSE=1 for the traceback)", file=out)
+
+async def test_basic_integration(out):
     """Test basic integration without browser automation"""
-    print("🔧 Testing Playwright Test Runner Integration...")
+    print("🔧 Testing Playwright Test Runner Integration...", file=out)
+    
+    if _runner_error is not None:
+        print(f"❌ Integration test failed: {_runner_error}", file=out)
+        report_exception(_runner_error, out)
+        return False
     
     try:
-        # Test imports
-        from app.services.playwright_test_runner import PlaywrightTestRunner, TestResult, ScreenshotManager
-        from app.models.schemas import FormField, FieldType
-        from app.api.testing import execute_test_run
-        print("✅ All imports successful")
+        print("✅ All imports successful", file=out)
         
         # Test TestResult creation
         result = TestResult(
@@ -29,12 +57,12 @@ async def test_basic_integration():
             success=True,
             error_message=None
         )
-        print(f"✅ TestResult created: {result.field_id}")
+        print(f"✅ TestResult created: {result.field_id}", file=out)
         
         # Test ScreenshotManager
         manager = ScreenshotManager("test_screenshots")
         filename = manager._generate_filename(123, "test")
-        print(f"✅ Screenshot filename generated: {filename}")
+        print(f"✅ Screenshot filename generated: {filename}", file=out)
         
         # Test FormField creation
         field = FormField(
@@ -43,32 +71,34 @@ async def test_basic_integration():
             type=FieldType.TEXT,
             required=True
         )
-        print(f"✅ FormField created: {field.field_id}")
+        print(f"✅ FormField created: {field.field_id}", file=out)
         
-        print("\n🎉 BASIC INTEGRATION TEST PASSED!")
-        print("📋 Components tested:")
-        print("   • PlaywrightTestRunner import")
-        print("   • TestResult creation")
-        print("   • ScreenshotManager")
-        print("   • FormField creation")
-        print("   • execute_test_run function import")
+        print("\n🎉 BASIC INTEGRATION TEST PASSED!", file=out)
+        print("📋 Components tested:", file=out)
+        print("   • PlaywrightTestRunner import", file=out)
+        print("   • TestResult creation", file=out)
+        print("   • ScreenshotManager", file=out)
+        print("   • FormField creation", file=out)
+        print("   • execute_test_run function import", file=out)
         
         return True
         
     except Exception as e:
-        print(f"❌ Integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Integration test failed: {e}", file=out)
+        report_exception(e, out)
         return False
 
-async def test_crud_integration():
+async def test_crud_integration(out):
     """Test CRUD operations integration"""
-    print("\n🔧 Testing CRUD Integration...")
+    print("\n🔧 Testing CRUD Integration...", file=out)
+    
+    if _crud_error is not None:
+        print(f"❌ CRUD integration test failed: {_crud_error}", file=out)
+        report_exception(_crud_error, out)
+        return False
     
     try:
-        from app.models.crud import TestRunCRUD, ScreenshotCRUD
-        from app.models.schemas import TestStatus
-        print("✅ CRUD imports successful")
+        print("✅ CRUD imports successful", file=out)
         
         # Check methods exist
         assert hasattr(TestRunCRUD, 'update_results'), "TestRunCRUD.update_results missing"
@@ -76,48 +106,63 @@ async def test_crud_integration():
         assert hasattr(TestRunCRUD, 'delete'), "TestRunCRUD.delete missing"
         assert hasattr(ScreenshotCRUD, 'create'), "ScreenshotCRUD.create missing"
         assert hasattr(ScreenshotCRUD, 'get_by_test_run_id'), "ScreenshotCRUD.get_by_test_run_id missing"
-        print("✅ All required CRUD methods exist")
+        print("✅ All required CRUD methods exist", file=out)
         
         # Test TestStatus enum
         assert hasattr(TestStatus, 'PENDING'), "TestStatus.PENDING missing"
         assert hasattr(TestStatus, 'RUNNING'), "TestStatus.RUNNING missing"
         assert hasattr(TestStatus, 'COMPLETED'), "TestStatus.COMPLETED missing"
         assert hasattr(TestStatus, 'FAILED'), "TestStatus.FAILED missing"
-        print("✅ TestStatus enum complete")
+        print("✅ TestStatus enum complete", file=out)
         
-        print("\n🎉 CRUD INTEGRATION TEST PASSED!")
+        print("\n🎉 CRUD INTEGRATION TEST PASSED!", file=out)
         return True
         
     except Exception as e:
-        print(f"❌ CRUD integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ CRUD integration test failed: {e}", file=out)
+        report_exception(e, out)
         return False
 
-async def main():
-    """Run validation tests"""
-    print("🚀 DELIVERABLE 5: PLAYWRIGHT TEST RUNNER - VALIDATION TEST")
-    print("=" * 60)
+async def main(out):
+    """Run validation tests, writing the report to out"""
+    print("🚀 DELIVERABLE 5: PLAYWRIGHT TEST RUNNER - VALIDATION TEST", file=out)
+    print("=" * 60, file=out)
     
-    test1 = await test_basic_integration()
-    test2 = await test_crud_integration()
+    test1 = await test_basic_integration(out)
+    test2 = await test_crud_integration(out)
     
     if test1 and test2:
-        print("\n" + "=" * 60)
-        print("🏆 DELIVERABLE 5: PLAYWRIGHT TEST RUNNER - VALIDATION COMPLETE!")
-        print("\n✅ Core Implementation Status:")
-        print("   • PlaywrightTestRunner service ✅")
-        print("   • ScreenshotManager ✅")
-        print("   • TestResult tracking ✅")
-        print("   • Background task execution ✅")
-        print("   • CRUD operations ✅")
-        print("   • API endpoints ✅")
-        print("\n🎯 Ready for production testing and Deliverable 6!")
+        print("\n" + "=" * 60, file=out)
+        print("🏆 DELIVERABLE 5: PLAYWRIGHT TEST RUNNER - VALIDATION COMPLETE!", file=out)
+        print("\n✅ Core Implementation Status:", file=out)
+        print("   • PlaywrightTestRunner service ✅", file=out)
+        print("   • ScreenshotManager ✅", file=out)
+        print("   • TestResult tracking ✅", file=out)
+        print("   • Background task execution ✅", file=out)
+        print("   • CRUD operations ✅", file=out)
+        print("   • API endpoints ✅", file=out)
+        print("\n🎯 Ready for production testing and Deliverable 6!", file=out)
         return True
     else:
-        print("\n❌ Validation failed - check errors above")
+        print("\n❌ Validation failed - check errors above", file=out)
         return False
 
+def run_validation(loop=None):
+    """Run validation on the given event loop, or on a new one that is closed afterwards"""
+    out = io.StringIO()
+    
+    if loop is not None:
+        success = loop.run_until_complete(main(out))
+    else:
+        loop = asyncio.new_event_loop()
+        try:
+            success = loop.run_until_complete(main(out))
+        finally:
+            loop.close()
+    
+    sys.stdout.write(out.getvalue())
+    return success
+
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    success = run_validation()
     sys.exit(0 if success else 1)
@@ -5,34 +5,68 @@ Tests Playwright Test Runner implementation without browser automation
 """
 
 import asyncio
+import inspect
+import io
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Add backend to Python path
 sys.path.append(str(Path(__file__).parent))
 
-def test_imports():
+# Import everything under test once; each check reuses these references.
+# Schema, runner and generator groups fail separately so each check only
+# reports the imports it actually uses.
+try:
+    from app.models.schemas import FormField, FieldType, TestStatus
+    _schema_error = None
+except Exception as e:
+    _schema_error = e
+
+try:
+    from app.services.playwright_test_runner import PlaywrightTestRunner, TestResult, ScreenshotManager
+    from app.models.crud import TestRunCRUD, ScreenshotCRUD
+    from app.api.testing import execute_test_run
+
+    TESTRUN_METHODS = set(dir(TestRunCRUD))
+    SCREENSHOT_METHODS = set(dir(ScreenshotCRUD))
+    _runner_error = None
+except Exception as e:
+    _runner_error = e
+
+try:
+    from app.services.ai_data_generator import AIDataGenerator, TestScenario
+    _generator_error = None
+except Exception as e:
+    _generator_error = e
+
+EXPECTED_TEST_RUN_PARAMS = frozenset(['test_run_id', 'page_url', 'fields', 'test_data'])
+
+@lru_cache(maxsize=None)
+def _signature(func):
+    """Cached inspect.signature for repeated validation runs"""
+    return inspect.signature(func)
+
+def test_imports(out):
     """Test all required imports work"""
-    try:
-        # Core service imports
-        from app.services.playwright_test_runner import PlaywrightTestRunner, TestResult, ScreenshotManager
-        from app.models.schemas import FormField, FieldType, TestStatus
-        from app.models.crud import TestRunCRUD, ScreenshotCRUD
-        from app.api.testing import execute_test_run
-        
-        print("✅ All imports successful")
-        return True
-    except Exception as e:
-        print(f"❌ Import failed: {e}")
+    import_error = _schema_error or _runner_error
+    if import_error is not None:
+        print(f"❌ Import failed: {import_error}", file=out)
         return False
+    
+    print("✅ All imports successful", file=out)
+    return True
 
-def test_classes():
+def test_classes(out):
     """Test class instantiation and basic methods"""
+    import_error = _schema_error or _runner_error
+    if import_error is not None:
+        print(f"❌ Class test failed: {import_error}", file=out)
+        return False
+    
     try:
-        from app.services.playwright_test_runner import TestResult, ScreenshotManager
-        from app.models.schemas import FormField, FieldType
-        
         # Test TestResult
         result = TestResult(
             field_id="test_field",
@@ -43,14 +77,14 @@ def test_classes():
         )
         assert result.field_id == "test_field"
         assert result.success == True
-        print("✅ TestResult class working")
+        print("✅ TestResult class working", file=out)
         
         # Test ScreenshotManager
         manager = ScreenshotManager("test_screenshots")
         filename = manager._generate_filename(123, "test_scenario")
         assert "test_123_test_scenario" in filename
         assert filename.endswith(".png")
-        print("✅ ScreenshotManager class working")
+        print("✅ ScreenshotManager class working", file=out)
         
         # Test FormField
         field = FormField(
@@ -62,84 +96,85 @@ def test_classes():
         )
         assert field.field_id == "email"
         assert field.type == FieldType.EMAIL
-        print("✅ FormField class working")
+        print("✅ FormField class working", file=out)
         
         return True
     except Exception as e:
-        print(f"❌ Class test failed: {e}")
+        print(f"❌ Class test failed: {e}", file=out)
         return False
 
-def test_crud_methods():
+def test_crud_methods(out):
     """Test CRUD method existence"""
+    if _runner_error is not None:
+        print(f"❌ CRUD test failed: {_runner_error}", file=out)
+        return False
+    
     try:
-        from app.models.crud import TestRunCRUD, ScreenshotCRUD
-        
         # Check TestRunCRUD methods
-        required_methods = ['create', 'get_by_id', 'update_results', 'update_status', 'delete']
-        for method in required_methods:
-            assert hasattr(TestRunCRUD, method), f"TestRunCRUD.{method} missing"
-        print("✅ TestRunCRUD methods present")
+        missing = {'create', 'get_by_id', 'update_results', 'update_status', 'delete'} - TESTRUN_METHODS
+        assert not missing, f"TestRunCRUD methods missing: {sorted(missing)}"
+        print("✅ TestRunCRUD methods present", file=out)
         
         # Check ScreenshotCRUD methods
-        required_methods = ['create', 'get_by_test_run_id', 'create_screenshot']
-        for method in required_methods:
-            assert hasattr(ScreenshotCRUD, method), f"ScreenshotCRUD.{method} missing"
-        print("✅ ScreenshotCRUD methods present")
+        missing = {'create', 'get_by_test_run_id', 'create_screenshot'} - SCREENSHOT_METHODS
+        assert not missing, f"ScreenshotCRUD methods missing: {sorted(missing)}"
+        print("✅ ScreenshotCRUD methods present", file=out)
         
         return True
     except Exception as e:
-        print(f"❌ CRUD test failed: {e}")
+        print(f"❌ CRUD test failed: {e}", file=out)
         return False
 
-def test_enums():
+def test_enums(out):
     """Test enum values"""
+    if _schema_error is not None:
+        print(f"❌ Enum test failed: {_schema_error}", file=out)
+        return False
+    
     try:
-        from app.models.schemas import TestStatus, FieldType
-        
         # Test TestStatus
         assert hasattr(TestStatus, 'PENDING')
         assert hasattr(TestStatus, 'RUNNING')
         assert hasattr(TestStatus, 'COMPLETED')
         assert hasattr(TestStatus, 'FAILED')
-        print("✅ TestStatus enum complete")
+        print("✅ TestStatus enum complete", file=out)
         
         # Test FieldType
         field_types = ['TEXT', 'EMAIL', 'PASSWORD', 'PHONE', 'CHECKBOX', 'RADIO', 'SELECT', 'TEXTAREA']
         for field_type in field_types:
             assert hasattr(FieldType, field_type), f"FieldType.{field_type} missing"
-        print("✅ FieldType enum complete")
+        print("✅ FieldType enum complete", file=out)
         
         return True
     except Exception as e:
-        print(f"❌ Enum test failed: {e}")
+        print(f"❌ Enum test failed: {e}", file=out)
         return False
 
-def test_api_functions():
+def test_api_functions(out):
     """Test API function existence"""
+    if _runner_error is not None:
+        print(f"❌ API function test failed: {_runner_error}", file=out)
+        return False
+    
     try:
-        from app.api.testing import execute_test_run
-        
         # Check function signature
-        import inspect
-        sig = inspect.signature(execute_test_run)
-        params = list(sig.parameters.keys())
-        
-        expected_params = ['test_run_id', 'page_url', 'fields', 'test_data']
-        for param in expected_params:
-            assert param in params, f"execute_test_run missing parameter: {param}"
+        missing = EXPECTED_TEST_RUN_PARAMS - _signature(execute_test_run).parameters.keys()
+        assert not missing, f"execute_test_run missing parameters: {sorted(missing)}"
         
-        print("✅ execute_test_run function signature correct")
+        print("✅ execute_test_run function signature correct", file=out)
         return True
     except Exception as e:
-        print(f"❌ API function test failed: {e}")
+        print(f"❌ API function test failed: {e}", file=out)
         return False
 
-def test_data_integration():
+def test_data_integration(out):
     """Test integration with data generator"""
+    import_error = _schema_error or _generator_error
+    if import_error is not None:
+        print(f"❌ Data integration test failed: {import_error}", file=out)
+        return False
+    
     try:
-        from app.services.ai_data_generator import AIDataGenerator, TestScenario
-        from app.models.schemas import FormField, FieldType
-        
         # Test data generation
         fields = [
             FormField(field_id="name", name="name", type=FieldType.TEXT, required=True),
@@ -150,16 +185,26 @@ def test_data_integration():
         # Test method exists
         assert hasattr(generator, 'generate_test_data'), "generate_test_data method missing"
         
-        print("✅ Data generator integration ready")
+        print("✅ Data generator integration ready", file=out)
         return True
     except Exception as e:
-        print(f"❌ Data integration test failed: {e}")
+        print(f"❌ Data integration test failed: {e}", file=out)
         return False
 
+def run_check(test_name, test_func):
+    """Run one check, returning its result and buffered output"""
+    out = io.StringIO()
+    print(f"\n🔧 Running {test_name}...", file=out)
+    success = test_func(out)
+    if not success:
+        print(f"❌ {test_name} FAILED", file=out)
+    return success, out.getvalue()
+
 def main():
     """Run all validation tests"""
-    print("🚀 DELIVERABLE 5: PLAYWRIGHT TEST RUNNER - VALIDATION")
-    print("=" * 60)
+    out = io.StringIO()
+    print("🚀 DELIVERABLE 5: PLAYWRIGHT TEST RUNNER - VALIDATION", file=out)
+    print("=" * 60, file=out)
     
     tests = [
         ("Import Test", test_imports),
@@ -170,34 +215,35 @@ def main():
         ("Data Integration", test_data_integration)
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        print(f"\n🔧 Running {test_name}...")
-        if test_func():
-            passed += 1
-        else:
-            print(f"❌ {test_name} FAILED")
+    # Checks are independent, so run them together and print their output in order
+    with ThreadPoolExecutor(max_workers=total) as executor:
+        results = list(executor.map(lambda test: run_check(*test), tests))
     
-    print("\n" + "=" * 60)
-    print(f"📊 VALIDATION RESULTS: {passed}/{total} tests passed")
+    for _, output in results:
+        out.write(output)
+    passed = sum(1 for success, _ in results if success)
+    
+    print("\n" + "=" * 60, file=out)
+    print(f"📊 VALIDATION RESULTS: {passed}/{total} tests passed", file=out)
     
     if passed == total:
-        print("🏆 DELIVERABLE 5: PLAYWRIGHT TEST RUNNER - VALIDATION COMPLETE!")
-        print("\n✅ Implementation Status:")
-        print("   • PlaywrightTestRunner service ✅")
-        print("   • TestResult tracking ✅") 
-        print("   • ScreenshotManager ✅")
-        print("   • Background task execution ✅")
-        print("   • CRUD operations ✅")
-        print("   • API endpoints ✅")
-        print("   • Data generator integration ✅")
-        print("\n🎯 READY FOR DELIVERABLE 6: Results API & Analytics")
-        return True
+        print("🏆 DELIVERABLE 5: PLAYWRIGHT TEST RUNNER - VALIDATION COMPLETE!", file=out)
+        print("\n✅ Implementation Status:", file=out)
+        print("   • PlaywrightTestRunner service ✅", file=out)
+        print("   • TestResult tracking ✅", file=out) 
+        print("   • ScreenshotManager ✅", file=out)
+        print("   • Background task execution ✅", file=out)
+        print("   • CRUD operations ✅", file=out)
+        print("   • API endpoints ✅", file=out)
+        print("   • Data generator integration ✅", file=out)
+        print("\n🎯 READY FOR DELIVERABLE 6: Results API & Analytics", file=out)
     else:
-        print("❌ Validation incomplete - check errors above")
-        return False
+        print("❌ Validation incomplete - check errors above", file=out)
+    
+    sys.stdout.write(out.getvalue())
+    return passed == total
 
 if __name__ == "__main__":
     success = main()
@@ -4,17 +4,51 @@ Deliverable 6 Completion Summary and Validation
 Results API & Analytics Implementation Status
 """
 
+import io
 import os
-import json
+import sys
+import mmap
+import orjson
 from datetime import datetime
 
-def validate_deliverable6_implementation():
-    """Validate Deliverable 6 implementation completeness"""
+def find_tokens(filepath, tokens, file_stat):
+    """Return the subset of tokens present in a file, searched over one mmap of it
+
+    file_stat is the entry from stat_files(), or None when the file is missing.
+    """
+    if file_stat is None:
+        return None
+    if file_stat.st_size == 0:
+        return set()
+    
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Search each token independently so tokens sharing a prefix are all reported
+        return {token for token in tokens if mm.find(token.encode()) != -1}
+
+def stat_files(filepaths):
+    """Stat the given files with one directory scan per parent directory"""
+    wanted = {os.path.normpath(filepath) for filepath in filepaths}
+    stats = {}
+    
+    for directory in {os.path.dirname(filepath) or "." for filepath in wanted}:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    path = os.path.normpath(entry.path)
+                    if path in wanted:
+                        stats[path] = entry.stat()
+        except FileNotFoundError:
+            continue
     
-    print("📊 DELIVERABLE 6: RESULTS API & ANALYTICS")
-    print("=" * 60)
-    print("🎯 Implementation Status Summary")
-    print()
+    return stats
+
+def validate_deliverable6_implementation(out):
+    """Validate Deliverable 6 implementation completeness, writing the report to out"""
+    
+    print("📊 DELIVERABLE 6: RESULTS API & ANALYTICS", file=out)
+    print("=" * 60, file=out)
+    print("🎯 Implementation Status Summary", file=out)
+    print(file=out)
     
     # Check if required files exist
     required_files = {
@@ -27,96 +61,102 @@ def validate_deliverable6_implementation():
     
     implementation_status = {}
     
-    print("📁 File Implementation Status:")
-    print("-" * 40)
+    print("📁 File Implementation Status:", file=out)
+    print("-" * 40, file=out)
+    
+    file_stats = stat_files(required_files.values())
     
     for description, filepath in required_files.items():
-        if os.path.exists(filepath):
-            file_size = os.path.getsize(filepath)
+        file_stat = file_stats.get(os.path.normpath(filepath))
+        
+        if file_stat is not None:
+            file_size = file_stat.st_size
             implementation_status[description] = {
                 "exists": True,
                 "size_kb": round(file_size / 1024, 1)
             }
-            print(f"  ✅ {description}: {file_size:,} bytes")
+            print(f"  ✅ {description}: {file_size:,} bytes", file=out)
         else:
             implementation_status[description] = {"exists": False}
-            print(f"  ❌ {description}: Missing")
+            print(f"  ❌ {description}: Missing", file=out)
     
     # Analyze implementation features
-    print("\n🔧 Core Features Implementation:")
-    print("-" * 40)
+    print("\n🔧 Core Features Implementation:", file=out)
+    print("-" * 40, file=out)
     
     features_implemented = {}
     
     # Check analytics service features
-    analytics_file = "app/services/analytics_service.py"
-    if os.path.exists(analytics_file):
-        with open(analytics_file, 'r') as f:
-            content = f.read()
-            
-        analytics_methods = [
-            ("get_global_metrics", "Global system metrics"),
-            ("get_performance_metrics", "Performance analysis"),
-            ("get_field_type_analytics", "Field type statistics"),
-            ("get_failure_analysis", "Failure pattern analysis"),
-            ("get_metadata_insights", "Individual form insights"),
-            ("get_screenshot_analytics", "Screenshot storage analytics"),
-            ("generate_executive_summary", "Executive reporting")
-        ]
-        
+    analytics_methods = [
+        ("get_global_metrics", "Global system metrics"),
+        ("get_performance_metrics", "Performance analysis"),
+        ("get_field_type_analytics", "Field type statistics"),
+        ("get_failure_analysis", "Failure pattern analysis"),
+        ("get_metadata_insights", "Individual form insights"),
+        ("get_screenshot_analytics", "Screenshot storage analytics"),
+        ("generate_executive_summary", "Executive reporting")
+    ]
+    
+    found = find_tokens(
+        "app/services/analytics_service.py",
+        [method for method, _ in analytics_methods],
+        file_stats.get(os.path.normpath("app/services/analytics_service.py"))
+    )
+    if found is not None:
         for method, description in analytics_methods:
-            if method in content:
+            if method in found:
                 features_implemented[description] = True
-                print(f"  ✅ {description}")
+                print(f"  ✅ {description}", file=out)
             else:
                 features_implemented[description] = False
-                print(f"  ❌ {description}: Not found")
+                print(f"  ❌ {description}: Not found", file=out)
     
     # Check API endpoints
-    results_file = "app/api/results.py"
-    if os.path.exists(results_file):
-        with open(results_file, 'r') as f:
-            content = f.read()
-            
-        api_endpoints = [
-            ("/analytics/global", "Global Analytics Endpoint"),
-            ("/analytics/performance", "Performance Analytics Endpoint"),
-            ("/analytics/field-types", "Field Type Analytics Endpoint"),
-            ("/analytics/failures", "Failure Analysis Endpoint"),
-            ("/analytics/screenshots", "Screenshot Analytics Endpoint"),
-            ("/analytics/metadata/", "Metadata Insights Endpoint"),
-            ("/reports/executive-summary", "Executive Summary Endpoint"),
-            ("/reports/dashboard", "Dashboard Data Endpoint"),
-            ("/analytics/trends/success-rate", "Success Rate Trends Endpoint"),
-            ("/analytics/comparison/metadata", "Metadata Comparison Endpoint"),
-            ("/analytics/health-check", "Health Monitoring Endpoint")
-        ]
-        
-        print("\n🌐 API Endpoints Implementation:")
-        print("-" * 40)
+    api_endpoints = [
+        ("/analytics/global", "Global Analytics Endpoint"),
+        ("/analytics/performance", "Performance Analytics Endpoint"),
+        ("/analytics/field-types", "Field Type Analytics Endpoint"),
+        ("/analytics/failures", "Failure Analysis Endpoint"),
+        ("/analytics/screenshots", "Screenshot Analytics Endpoint"),
+        ("/analytics/metadata/", "Metadata Insights Endpoint"),
+        ("/reports/executive-summary", "Executive Summary Endpoint"),
+        ("/reports/dashboard", "Dashboard Data Endpoint"),
+        ("/analytics/trends/success-rate", "Success Rate Trends Endpoint"),
+        ("/analytics/comparison/metadata", "Metadata Comparison Endpoint"),
+        ("/analytics/health-check", "Health Monitoring Endpoint")
+    ]
+    
+    found = find_tokens(
+        "app/api/results.py",
+        [endpoint for endpoint, _ in api_endpoints],
+        file_stats.get(os.path.normpath("app/api/results.py"))
+    )
+    if found is not None:
+        print("\n🌐 API Endpoints Implementation:", file=out)
+        print("-" * 40, file=out)
         
         for endpoint, description in api_endpoints:
-            if endpoint in content:
+            if endpoint in found:
                 features_implemented[f"API: {description}"] = True
-                print(f"  ✅ {description}")
+                print(f"  ✅ {description}", file=out)
             else:
                 features_implemented[f"API: {description}"] = False
-                print(f"  ❌ {description}: Not implemented")
+                print(f"  ❌ {description}: Not implemented", file=out)
     
     # Calculate completion statistics
     total_features = len(features_implemented)
     implemented_features = sum(1 for status in features_implemented.values() if status)
     completion_rate = (implemented_features / total_features * 100) if total_features > 0 else 0
     
-    print(f"\n📈 Implementation Statistics:")
-    print("-" * 40)
-    print(f"  Total Features: {total_features}")
-    print(f"  Implemented: {implemented_features}")
-    print(f"  Completion Rate: {completion_rate:.1f}%")
+    print(f"\n📈 Implementation Statistics:", file=out)
+    print("-" * 40, file=out)
+    print(f"  Total Features: {total_features}", file=out)
+    print(f"  Implemented: {implemented_features}", file=out)
+    print(f"  Completion Rate: {completion_rate:.1f}%", file=out)
     
     # Advanced features check
-    print(f"\n🚀 Advanced Features:")
-    print("-" * 40)
+    print(f"\n🚀 Advanced Features:", file=out)
+    print("-" * 40, file=out)
     
     advanced_features = [
         ("Dashboard optimized data structure", "dashboard" in str(features_implemented)),
@@ -129,11 +169,11 @@ def validate_deliverable6_implementation():
     
     for feature, implemented in advanced_features:
         status = "✅" if implemented else "❌"
-        print(f"  {status} {feature}")
+        print(f"  {status} {feature}", file=out)
     
     # Integration readiness
-    print(f"\n🔗 Integration Readiness:")
-    print("-" * 40)
+    print(f"\n🔗 Integration Readiness:", file=out)
+    print("-" * 40, file=out)
     
     integration_checks = [
         ("FastAPI router integration", os.path.exists("app/api/results.py")),
@@ -145,11 +185,11 @@ def validate_deliverable6_implementation():
     
     for check, status in integration_checks:
         status_icon = "✅" if status else "❌"
-        print(f"  {status_icon} {check}")
+        print(f"  {status_icon} {check}", file=out)
     
     # Generate summary
-    print(f"\n🎯 DELIVERABLE 6 SUMMARY:")
-    print("=" * 60)
+    print(f"\n🎯 DELIVERABLE 6 SUMMARY:", file=out)
+    print("=" * 60, file=out)
     
     if completion_rate >= 90:
         status = "🎉 EXCELLENT"
@@ -164,13 +204,13 @@ def validate_deliverable6_implementation():
         status = "❌ POOR"
         message = "Significant implementation work required"
     
-    print(f"Status: {status}")
-    print(f"Completion: {completion_rate:.1f}%")
-    print(f"Assessment: {message}")
+    print(f"Status: {status}", file=out)
+    print(f"Completion: {completion_rate:.1f}%", file=out)
+    print(f"Assessment: {message}", file=out)
     
     # Key capabilities
-    print(f"\n🔑 Key Capabilities Delivered:")
-    print("-" * 40)
+    print(f"\n🔑 Key Capabilities Delivered:", file=out)
+    print("-" * 40, file=out)
     
     key_capabilities = [
         "📊 Global system metrics and KPIs",
@@ -186,17 +226,17 @@ def validate_deliverable6_implementation():
     ]
     
     for capability in key_capabilities:
-        print(f"  ✅ {capability}")
+        print(f"  ✅ {capability}", file=out)
     
     # Next steps
-    print(f"\n🚀 Next Steps:")
-    print("-" * 40)
-    print("  1. Start FastAPI server to test endpoints")
-    print("  2. Run analytics validation script")
-    print("  3. Execute integration tests")
-    print("  4. Validate with real test data")
-    print("  5. Optimize query performance if needed")
-    print("  6. Prepare for frontend dashboard integration")
+    print(f"\n🚀 Next Steps:", file=out)
+    print("-" * 40, file=out)
+    print("  1. Start FastAPI server to test endpoints", file=out)
+    print("  2. Run analytics validation script", file=out)
+    print("  3. Execute integration tests", file=out)
+    print("  4. Validate with real test data", file=out)
+    print("  5. Optimize query performance if needed", file=out)
+    print("  6. Prepare for frontend dashboard integration", file=out)
     
     # Save summary
     summary = {
@@ -212,20 +252,23 @@ def validate_deliverable6_implementation():
         "key_capabilities": key_capabilities
     }
     
-    with open("deliverable6_implementation_summary.json", "w") as f:
-        json.dump(summary, f, indent=2)
+    with open("deliverable6_implementation_summary.json", "wb") as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     
-    print(f"\n💾 Summary saved to: deliverable6_implementation_summary.json")
+    print(f"\n💾 Summary saved to: deliverable6_implementation_summary.json", file=out)
     
     return completion_rate >= 75
 
 if __name__ == "__main__":
-    print("🔍 Validating Deliverable 6 Implementation...")
-    print()
+    out = io.StringIO()
+    print("🔍 Validating Deliverable 6 Implementation...", file=out)
+    print(file=out)
     
-    success = validate_deliverable6_implementation()
+    success = validate_deliverable6_implementation(out)
     
     if success:
-        print(f"\n🎊 Deliverable 6 is ready for testing and deployment!")
+        print(f"\n🎊 Deliverable 6 is ready for testing and deployment!", file=out)
     else:
-        print(f"\n🛠️  Deliverable 6 needs additional implementation work")
+        print(f"\n🛠️  Deliverable 6 needs additional implementation work", file=out)
+    
+    sys.stdout.write(out.getvalue())
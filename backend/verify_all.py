@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Run the Deliverable 3 and Deliverable 4 verifications side by side
+Each script runs in its own process and prints its report when it finishes
+"""
+import contextlib
+import importlib
+import io
+import sys
+from multiprocessing import Lock, Process
+
+SCRIPTS = ["verify_deliverable3", "verify_deliverable4"]
+
+def run_script(name, output_lock):
+    """Run one verification script's main() and print its buffered report"""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+        try:
+            success = importlib.import_module(name).main()
+        except Exception as e:
+            print(f"❌ {name} crashed: {e}")
+            success = False
+    
+    with output_lock:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+    sys.exit(0 if success else 1)
+
+def main():
+    output_lock = Lock()
+    procs = [Process(target=run_script, args=(name, output_lock)) for name in SCRIPTS]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+    
+    print("=" * 70)
+    for name, proc in zip(SCRIPTS, procs):
+        print(f"{'✅' if proc.exitcode == 0 else '❌'} {name} (exit code: {proc.exitcode})")
+    return 0 if all(proc.exitcode == 0 for proc in procs) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
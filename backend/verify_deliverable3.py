@@ -4,34 +4,128 @@ Final verification script for Deliverable 3 completion
 Run this to verify everything is working correctly
 """
 
+import io
+import json
+import os
 import subprocess
 import sys
-import os
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent
+_CACHED_CWD = str(BACKEND_DIR)
+VENV_BIN = BACKEND_DIR / 'venv' / 'bin'
+VENV_PYTHON = str(VENV_BIN / 'python')
+# Shared bytecode cache so repeat runs (and CI jobs reusing /tmp) skip compilation
+PYCACHE_PREFIX = str(Path(tempfile.gettempdir()) / 'verify_pyc')
+
+# Runs inside one long-lived venv interpreter. Each stdin line is a JSON
+# [kind, target] check; the reply is a single JSON line on stdout.
+WORKER_SCRIPT = r'''
+import collections, contextlib, io, json, sys, traceback
+
+class Tail(io.TextIOBase):
+    """Keeps only the last few non-blank lines written to it"""
+    def __init__(self, size=3):
+        self.lines = collections.deque(maxlen=size)
+        self.partial = ""
+
+    def write(self, text):
+        *complete, self.partial = (self.partial + text).split("\n")
+        self.lines.extend(line for line in complete if line.strip())
+        return len(text)
+
+    def getvalue(self):
+        return "\n".join([*self.lines, self.partial])
+
+def run(kind, target):
+    if kind == "python":
+        exec(target, {})
+        return 0
+    import pytest
+    return int(pytest.main(target))
+
+for line in sys.stdin:
+    kind, target = json.loads(line)
+    out, err = Tail(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            returncode = run(kind, target)
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+    reply = {"returncode": returncode, "stdout": out.getvalue(), "stderr": err.getvalue()}
+    sys.stdout.write(json.dumps(reply) + "\n")
+    sys.stdout.flush()
+'''
+
+def worker_env():
+    """Environment for venv interpreters launched by this script"""
+    # Same PATH that `source venv/bin/activate` would give, without the shell.
+    # Verification runs are one-shot, so every pytest session skips .pytest_cache.
+    env = {
+        **os.environ,
+        'PATH': f"{VENV_BIN}{os.pathsep}{os.environ.get('PATH', '')}",
+        'PYTEST_ADDOPTS': ' '.join(filter(None, [os.environ.get('PYTEST_ADDOPTS'), '-p no:cacheprovider'])),
+        'PYTHONPYCACHEPREFIX': PYCACHE_PREFIX,
+    }
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+def precompile(env):
+    """Byte-compile app and tests in parallel before the worker imports them"""
+    # Best effort: the worker's imports report any real compile errors per check
+    try:
+        result = subprocess.run(
+            [VENV_PYTHON, '-m', 'compileall', '-q', '-j', '0', 'app', 'tests'],
+            cwd=_CACHED_CWD, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    except OSError as e:
+        print(f"⚠️  Precompile skipped: {e}")
+        return
+    if result.returncode != 0:
+        print(f"⚠️  Precompile failed (exit code: {result.returncode}), continuing")
+
+def start_worker(env):
+    """Launch the shared venv interpreter that runs every check"""
+    return subprocess.Popen(
+        [VENV_PYTHON, '-u', '-c', WORKER_SCRIPT],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=_CACHED_CWD, env=env
+    )
 
-def run_command(cmd, description):
-    """Run a command and return success status"""
-    print(f"\n🔧 {description}")
-    print(f"   Command: {cmd}")
+def run_command(worker, check, description):
+    """Send a check to the worker and return its success status and report text"""
+    out = io.StringIO()
+    kind, target = check
+    print(f"\n🔧 {description}", file=out)
+    print(f"   Command: {target if kind == 'python' else 'pytest ' + ' '.join(target)}", file=out)
     
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd='/Users/jm237/Desktop/copilot-test-framework/backend')
+        if worker is None:
+            raise RuntimeError(f"worker not running ({VENV_PYTHON} could not be started)")
+        worker.stdin.write(json.dumps(check) + '\n')
+        worker.stdin.flush()
+        reply = worker.stdout.readline()
+        if not reply:
+            raise RuntimeError(f"worker exited (exit code: {worker.poll()})")
+        result = json.loads(reply)
         
-        if result.returncode == 0:
-            print(f"   ✅ Success")
-            if result.stdout.strip():
+        if result["returncode"] == 0:
+            print(f"   ✅ Success", file=out)
+            if result["stdout"].strip():
                 # Show last few lines of output
-                lines = result.stdout.strip().split('\n')
+                lines = result["stdout"].strip().split('\n')
                 for line in lines[-3:]:
-                    print(f"   📝 {line}")
-            return True
+                    print(f"   📝 {line}", file=out)
+            return True, out.getvalue()
         else:
-            print(f"   ❌ Failed (exit code: {result.returncode})")
-            if result.stderr:
-                print(f"   Error: {result.stderr.strip()}")
-            return False
+            print(f"   ❌ Failed (exit code: {result['returncode']})", file=out)
+            if result["stderr"]:
+                print(f"   Error: {result['stderr'].strip()}", file=out)
+            return False, out.getvalue()
     except Exception as e:
-        print(f"   ❌ Exception: {str(e)}")
-        return False
+        print(f"   ❌ Exception: {str(e)}", file=out)
+        return False, out.getvalue()
 
 def main():
     print("=" * 70)
@@ -39,38 +133,40 @@ def main():
     print("📦 Web Scraper Implementation - Final Check")
     print("=" * 70)
     
-    # Change to backend directory
-    os.chdir('/Users/jm237/Desktop/copilot-test-framework/backend')
-    
     tests = [
-        ("source venv/bin/activate && python -c \"import app.services.web_scraper; print('Web scraper import: OK')\"", 
-         "Import web scraper service"),
-        
-        ("source venv/bin/activate && python -c \"import app.services.github_scanner; print('GitHub scanner import: OK')\"", 
-         "Import GitHub scanner service"),
-        
-        ("source venv/bin/activate && python -c \"from app.models.schemas import SourceType, FieldType; print(f'Enums: {len(SourceType)} source types, {len(FieldType)} field types')\"", 
-         "Check updated enums"),
-        
-        ("source venv/bin/activate && python -c \"from app.api.extraction import router; print('Extraction API import: OK')\"", 
-         "Import extraction API"),
+        (("python", "from tests.smoke_imports import check_all; assert check_all()"), 
+         "Check scraper services, extraction API and schema enums"),
         
-        ("source venv/bin/activate && python -m pytest tests/test_extraction.py::test_extract_url_metadata -v", 
-         "Test URL extraction"),
-        
-        ("source venv/bin/activate && python -m pytest tests/test_metadata.py::test_metadata_workflow -v", 
-         "Test metadata workflow"),
-        
-        ("source venv/bin/activate && python -m pytest tests/ --tb=no -q", 
-         "Run full test suite"),
+        # One session collects the union, so the targeted tests are not run twice
+        (("pytest", ["tests/test_extraction.py::test_extract_url_metadata",
+                     "tests/test_metadata.py::test_metadata_workflow",
+                     "tests/", "--tb=no", "-q"]), 
+         "Test URL extraction, metadata workflow and full test suite"),
     ]
     
     passed = 0
     total = len(tests)
     
-    for cmd, description in tests:
-        if run_command(cmd, description):
-            passed += 1
+    # One warm interpreter runs every check, so app imports are paid once
+    env = worker_env()
+    precompile(env)
+    try:
+        worker = start_worker(env)
+    except OSError as e:
+        # Still report every check (as failed) and print the summary
+        print(f"\n❌ Could not start verification worker: {e}")
+        worker = None
+    try:
+        for check, description in tests:
+            success, output = run_command(worker, check, description)
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            if success:
+                passed += 1
+    finally:
+        if worker is not None:
+            worker.stdin.close()
+            worker.wait()
     
     print("\n" + "=" * 70)
     print(f"📊 VERIFICATION RESULTS: {passed}/{total} tests passed ({passed/total*100:.0f}%)")
@@ -90,6 +186,8 @@ def main():
     print("2. Test API: curl http://localhost:8000/health")
     print("3. Run tests: cd backend && python -m pytest tests/ -v")
     print("4. Test scraper: cd backend && python test_scraper.py")
+    
+    return passed == total
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
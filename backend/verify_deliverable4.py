@@ -3,16 +3,42 @@
 Final verification of Deliverable 4 completion
 Tests the complete data generation pipeline
 """
+import importlib.util
 import os
 import sys
 import json
+import threading
+import traceback
+from pathlib import Path
 
 # Add backend to path
-backend_path = "/Users/jm237/Desktop/copilot-test-framework/backend"
-sys.path.insert(0, backend_path)
+BACKEND_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Shared FormField kwargs; tests only spell out what differs per field
+BASE_FIELD_KWARGS = {
+    "xpath": "//input",
+    "css_selector": "input",
+    "required": False,
+    "placeholder": "",
+    "default_value": "",
+    "options": [],
+    "validation": None,
+    "is_visible": True,
+    "source_file": None
+}
+
+def _preload_main():
+    """Import the FastAPI app in the background so Test 6 finds it cached"""
+    try:
+        import app.main
+    except Exception:
+        pass  # Test 6 reports the import failure itself
 
 def main():
     """Main verification function"""
+    threading.Thread(target=_preload_main, daemon=True).start()
+    
     print("🔍 DELIVERABLE 4 VERIFICATION")
     print("=" * 40)
     
@@ -32,19 +58,17 @@ def main():
         # Test 3: Basic generation
         print("📋 Test 3: Basic Data Generation")
         email_field = FormField(
+            **{
+                **BASE_FIELD_KWARGS,
+                "xpath": "//input[@name='email']",
+                "css_selector": "input[name='email']",
+                "required": True,
+                "placeholder": "Enter email"
+            },
             field_id="email",
             label="Email Address",
             type=FieldType.EMAIL,
-            input_type="email",
-            xpath="//input[@name='email']",
-            css_selector="input[name='email']",
-            required=True,
-            placeholder="Enter email",
-            default_value="",
-            options=[],
-            validation=None,
-            is_visible=True,
-            source_file=None
+            input_type="email"
         )
         
         # Generate valid email
@@ -62,51 +86,45 @@ def main():
         # Test 4: Multiple field types
         print("📋 Test 4: Multiple Field Types")
         field_types = [FieldType.PASSWORD, FieldType.PHONE, FieldType.NUMBER, FieldType.CHECKBOX]
-        for field_type in field_types:
-            test_field = FormField(
+        fields = [
+            FormField(
                 field_id=f"test_{field_type.value}",
                 label=f"Test {field_type.value}",
                 type=field_type,
                 input_type=field_type.value,
-                xpath="//input",
-                css_selector="input",
-                required=False,
-                placeholder="",
-                default_value="",
-                options=[],
-                validation=None,
-                is_visible=True,
-                source_file=None
+                **BASE_FIELD_KWARGS
             )
-            
-            data = advanced_gen.generate_field_data(test_field, TestScenario.VALID, 1)
-            assert len(data) == 1
-            print(f"   ✅ {field_type.value}: {data[0]['value']}")
+            for field_type in field_types
+        ]
+        
+        data = advanced_gen.generate_bulk(fields, TestScenario.VALID, 1)
+        assert len(data) == len(field_types)
+        for field_type, item in zip(field_types, data):
+            print(f"   ✅ {field_type.value}: {item['value']}")
         
         # Test 5: API endpoint structure verification
         print("📋 Test 5: API Structure Verification")
-        try:
+        if importlib.util.find_spec("app.api.data_generation") is None:
+            print("   ⚠️  Could not verify API routes: app.api.data_generation not found")
+        else:
             from app.api.data_generation import router
             # Check if router has expected endpoints
-            routes = [route.path for route in router.routes]
+            route_set = {route.path.removeprefix(router.prefix) for route in router.routes}
             expected_routes = ["/{metadata_id}", "/bulk", "/field", "/scenarios", "/field-types"]
             
             for expected in expected_routes:
-                found = any(expected in route for route in routes)
-                if found:
+                if expected in route_set:
                     print(f"   ✅ Endpoint {expected} found")
                 else:
                     print(f"   ⚠️  Endpoint {expected} not found")
-        except Exception as e:
-            print(f"   ⚠️  Could not verify API routes: {e}")
         
         # Test 6: Integration with main app
         print("📋 Test 6: Main App Integration")
         try:
             from app.main import app
-            # Check if data generation router is included
-            app_routes = [route.path for route in app.routes]
-            data_gen_routes = [route for route in app_routes if "/generate" in route]
+            # Check if data generation router is included. Newer FastAPI versions keep
+            # included routers as nested entries in app.routes, so read the OpenAPI paths.
+            data_gen_routes = [path for path in app.openapi()["paths"] if path.startswith("/generate")]
             if data_gen_routes:
                 print(f"   ✅ Data generation routes registered: {len(data_gen_routes)} routes")
             else:
@@ -129,8 +147,7 @@ def main():
         
     except Exception as e:
         print(f"❌ Verification failed: {e}")
-        import traceback
-        traceback.print_exc()
+        traceback.print_exception(type(e), e, e.__traceback__, limit=10)
         return False
 
 if __name__ == "__main__":